@@ -3,145 +3,384 @@
 
 import argparse
 import hashlib
+import os
+import sys
+from concurrent.futures import ProcessPoolExecutor
 from datetime import date, datetime, timedelta
-from typing import List, Dict, Tuple
+from typing import TYPE_CHECKING, Any, Dict, Iterable, Iterator, List, Sequence, Tuple
 
-import pandas as pd
-from icalendar import Calendar, Event
+import numpy as np
+from python_calamine import CalamineWorkbook
+
+if TYPE_CHECKING:
+    import pandas as pd
+
+
+COLUMNS = ["start_date", "end_date", "title", "organizer", "tour", "location", "source", "source_url"]
+TEXT_DTYPES = {c: str for c in COLUMNS[2:]}
+
+PRODID = "-//US Pool Calendar//github//"
+CAL_END = b"END:VCALENDAR\r\n"
+FOLD_AT = 74  # content octets per physical line (75 with the leading space of continuations)
+FLUSH_EVERY = 256  # serialized events buffered between writes
+ONE_DAY = timedelta(days=1)
+
+# Event serialization is fanned out to worker processes only for large rosters
+# on multi-core machines. Rendering costs ~5us per event, while pickling the rows
+# out to the workers costs ~3us per event in the parent plus pool start-up, so the
+# pool only pays off from a few cores and tens of thousands of events.
+PARALLEL_MIN_EVENTS = 50_000
+PARALLEL_CHUNK = 1_000
 
 
 def parse_args():
     p = argparse.ArgumentParser()
-    p.add_argument("--xlsx", required=True, help="Input tournaments.xlsx")
+    p.add_argument("--xlsx", required=True, help="Input tournaments.xlsx (.csv / .parquet also accepted)")
     p.add_argument("--ics", required=True, help="Output tournaments.ics")
     p.add_argument("--ics-conflicts", required=True, help="Output tournaments-conflicts.ics")
     p.add_argument("--calname", default="US Pool – Tournaments", help="Calendar display name")
     p.add_argument("--uid-domain", default="uspool.local", help="UID suffix domain")
+    p.add_argument(
+        "--uid-hash",
+        choices=["blake2b", "sha1"],
+        default="blake2b",
+        help="UID digest (sha1 reproduces the UIDs of earlier exports)",
+    )
     return p.parse_args()
 
 
-def stable_uid(organizer: str, start: str, end: str, title: str, uid_domain: str) -> str:
-    raw = f"{organizer}|{start}|{end}|{title}".encode("utf-8")
-    h = hashlib.sha1(raw).hexdigest()
+def stable_uid(organizer: str, start: str, end: str, title: str, uid_domain: str, uid_hash: str = "blake2b") -> str:
+    raw = "|".join((organizer, start, end, title)).encode("utf-8")
+    if uid_hash == "sha1":
+        # UIDs emitted by earlier versions, for importers that dedupe on UID
+        h = hashlib.sha1(raw).hexdigest()
+    else:
+        h = hashlib.blake2b(raw, digest_size=10).hexdigest()
     return f"{h}@{uid_domain}"
 
 
-def to_date(s: str) -> date:
-    # start_date/end_date are ISO yyyy-mm-dd
-    return datetime.fromisoformat(str(s)).date()
+def read_rows(path: str) -> List[Dict]:
+    """
+    Loads and normalizes the tournaments sheet. Spreadsheets are read straight
+    through calamine; pandas is only imported for CSV/Parquet inputs.
+    """
+    ext = os.path.splitext(path)[1].lower()
+    if ext in (".csv", ".parquet"):
+        return normalize_frame(read_frame(path))
+    return normalize_records(CalamineWorkbook.from_path(path).get_sheet_by_index(0).to_python())
+
+
+def to_date(x: Any) -> date:
+    if isinstance(x, datetime):
+        return x.date()
+    if isinstance(x, date):
+        return x
+    # start_date/end_date are ISO yyyy-mm-dd (possibly followed by a time part)
+    return date.fromisoformat(str(x)[:10])
 
 
-def build_conflict_set(rows: List[Dict]) -> set:
+def normalize_records(table: List[list]) -> List[Dict]:
     """
-    Returns a set of indices that are in conflict with at least one other event.
-    Overlap is inclusive on days (same day counts).
+    Normalizes a sheet given as a list of rows, the first one holding the headers.
+    calamine returns empty cells as "" and numeric cells as float.
     """
-    # sort by start
-    indexed = list(enumerate(rows))
-    indexed.sort(key=lambda x: (x[1]["start"], x[1]["end"], x[1]["title"]))
+    if not table:
+        return []
+    col = {name: i for i, name in enumerate(table[0])}
+
+    def cell(rec: list, name: str) -> Any:
+        i = col.get(name)
+        v = rec[i] if i is not None and i < len(rec) else None
+        if isinstance(v, float) and v.is_integer():
+            return int(v)  # a numeric title such as 2026 renders "2026", not "2026.0"
+        return None if v == "" else v
+
+    rows: List[Dict] = []
+    for rec in table[1:]:
+        if all(v == "" for v in rec):
+            continue
+        start = to_date(cell(rec, "start_date"))
+        end = to_date(cell(rec, "end_date"))
+        title = cell(rec, "title")
+        organizer = cell(rec, "organizer")
+        tour = cell(rec, "tour")
+        location = cell(rec, "location")
+        source = cell(rec, "source")
+        source_url = cell(rec, "source_url")
+        rows.append(
+            {
+                "start": start,
+                "end": end,
+                "start_iso": start.isoformat(),
+                "end_iso": end.isoformat(),
+                "title": "" if title is None else str(title),
+                # few distinct values repeated on every row: share one string object each
+                "organizer": "" if organizer is None else sys.intern(str(organizer)),
+                "tour": "" if tour is None else sys.intern(str(tour)),
+                "location": None if location is None else str(location).strip(),
+                "source": "" if source is None else sys.intern(str(source)),
+                "source_url": "" if source_url is None else str(source_url),
+            }
+        )
+    return rows
 
-    conflict = set()
-    for i in range(len(indexed)):
-        idx_i, a = indexed[i]
-        for j in range(i + 1, len(indexed)):
-            idx_j, b = indexed[j]
-            # if next event starts after a ends, break (because sorted by start)
-            if b["start"] > a["end"]:
-                break
-            # overlap
-            if a["start"] <= b["end"] and b["start"] <= a["end"]:
-                conflict.add(idx_i)
-                conflict.add(idx_j)
-    return conflict
 
+def read_frame(path: str) -> "pd.DataFrame":
+    import pandas as pd
 
-def make_calendar(calname: str) -> Calendar:
-    cal = Calendar()
-    cal.add("prodid", "-//US Pool Calendar//github//")
-    cal.add("version", "2.0")
-    cal.add("calscale", "GREGORIAN")
-    cal.add("x-wr-calname", calname)
-    return cal
+    if path.lower().endswith(".csv"):
+        return pd.read_csv(path, usecols=lambda c: c in COLUMNS, dtype=TEXT_DTYPES)
+    return pd.read_parquet(path)
 
 
-def add_event(cal: Calendar, row: Dict, uid_domain: str, mark_conflict: bool):
-    ev = Event()
+def frame_dates(col: "pd.Series") -> List[date]:
+    import pandas as pd
 
-    start_d: date = row["start"]
-    end_d: date = row["end"]
+    if pd.api.types.is_datetime64_any_dtype(col):
+        # already parsed (e.g. Parquet): no per-row parsing at all
+        return col.dt.date.tolist()
+    return [to_date(x) for x in col.tolist()]
+
+
+def normalize_frame(df: "pd.DataFrame") -> List[Dict]:
+    """
+    Column-wise normalization of a DataFrame into one dict per event
+    (no per-row Series boxing as with iterrows).
+    """
+    df = df.reindex(columns=COLUMNS)
+
+    start = frame_dates(df["start_date"])
+    end = frame_dates(df["end_date"])
+    start_iso = [d.isoformat() for d in start]
+    end_iso = [d.isoformat() for d in end]
+    title = df["title"].fillna("").astype(str).tolist()
+    source_url = df["source_url"].fillna("").astype(str).tolist()
+    # few distinct values repeated on every row: share one string object each
+    organizer = [sys.intern(x) for x in df["organizer"].fillna("").astype(str).tolist()]
+    tour, source = ([sys.intern(x) for x in df[c].fillna("").astype(str).tolist()] for c in ("tour", "source"))
+    loc = df["location"]
+    location = loc.astype(str).str.strip().astype(object).where(loc.notna(), None).tolist()
+
+    return [
+        {
+            "start": s,
+            "end": e,
+            "start_iso": si,
+            "end_iso": ei,
+            "title": ti,
+            "organizer": o,
+            "tour": to,
+            "location": lo,
+            "source": so,
+            "source_url": su,
+        }
+        for s, e, si, ei, ti, o, to, lo, so, su in zip(
+            start, end, start_iso, end_iso, title, organizer, tour, location, source, source_url
+        )
+    ]
 
-    # all-day, DTEND is exclusive -> end + 1 day
-    ev.add("dtstart", start_d)
-    ev.add("dtend", end_d + timedelta(days=1))
 
+def build_conflict_mask(start_ord: np.ndarray, end_ord: np.ndarray) -> bytearray:
+    """
+    Takes parallel arrays of start/end day ordinals (inclusive) and returns a mask
+    aligned with them: 1 where the event is in conflict with at least one other
+    event, 0 otherwise. Overlap is inclusive on days (same day counts).
+    """
+    n = len(start_ord)
+    if n < 2:
+        return bytearray(n)
+
+    # sweep line: sort by start, then compare each start with the ends around it
+    order = np.argsort(start_ord, kind="stable")
+    s = start_ord[order]
+    e = end_ord[order]
+
+    # common case for a well-spread calendar: every event ends before the next one starts
+    if (s[1:] > e[:-1]).all():
+        return bytearray(n)
+
+    in_conflict = np.zeros(n, dtype=bool)
+    # overlaps an earlier event if it starts before the latest end seen so far
+    in_conflict[1:] = s[1:] <= np.maximum.accumulate(e)[:-1]
+    # overlaps a later event if the next start (the earliest later start) is before its end
+    in_conflict[:-1] |= s[1:] <= e[:-1]
+
+    mask = np.zeros(n, dtype=np.uint8)
+    mask[order[in_conflict]] = 1
+    return bytearray(mask.tobytes())
+
+
+def ics_escape(text: str) -> str:
+    # RFC 5545 TEXT value escaping
+    return (
+        text.replace("\\", "\\\\")
+        .replace(";", "\\;")
+        .replace(",", "\\,")
+        .replace("\r\n", "\\n")
+        .replace("\n", "\\n")
+    )
+
+
+def fold_line(line: str) -> bytes:
+    """
+    Encodes one content line, folded so that no physical line exceeds 75 octets.
+    Folds never split a UTF-8 sequence or a backslash escape.
+    """
+    data = line.encode("utf-8")
+    if len(data) <= FOLD_AT:
+        return data + b"\r\n"
+
+    out = bytearray()
+    i = 0
+    while len(data) - i > FOLD_AT:
+        j = i + FOLD_AT
+        while data[j] & 0xC0 == 0x80:  # UTF-8 continuation byte
+            j -= 1
+        k = j
+        while k > i and data[k - 1] == 0x5C:
+            k -= 1
+        if (j - k) % 2:  # don't separate a backslash escape from its character
+            j -= 1
+        out += data[i:j]
+        out += b"\r\n "
+        i = j
+    out += data[i:]
+    out += b"\r\n"
+    return bytes(out)
+
+
+def calendar_header(calname: str) -> bytes:
+    return b"".join(
+        fold_line(line)
+        for line in (
+            "BEGIN:VCALENDAR",
+            "VERSION:2.0",
+            "PRODID:" + ics_escape(PRODID),
+            "CALSCALE:GREGORIAN",
+            "X-WR-CALNAME:" + ics_escape(calname),
+        )
+    )
+
+
+def render_event(row: Dict, mark_conflict: bool) -> bytes:
+    """
+    Serializes one all-day VEVENT straight to bytes.
+    Property order follows the one icalendar used to emit.
+    """
     title = row["title"]
     if mark_conflict:
         title = f"⚠ {title}"
-        ev.add("categories", "CONFLICT")
-
-    ev.add("summary", title)
-
-    if row.get("location"):
-        ev.add("location", row["location"])
 
-    # Stable UID to avoid duplicates on refresh
-    ev.add("uid", stable_uid(row["organizer"], row["start_iso"], row["end_iso"], row["title"], uid_domain))
+    lines = [
+        "BEGIN:VEVENT",
+        "SUMMARY:" + ics_escape(title),
+        # all-day, DTEND is exclusive -> end + 1 day (precomputed)
+        "DTSTART;VALUE=DATE:" + row["dtstart"],
+        "DTEND;VALUE=DATE:" + row["dtend"],
+        # Stable UID to avoid duplicates on refresh
+        "UID:" + ics_escape(row["uid"]),
+    ]
+    if mark_conflict:
+        lines.append("CATEGORIES:CONFLICT")
 
     # Useful description
-    desc_lines = [
-        f"Organizer: {row.get('organizer','')}",
-        f"Tour: {row.get('tour','')}",
-        f"Source: {row.get('source','')}",
-        f"URL: {row.get('source_url','')}",
-    ]
-    ev.add("description", "\n".join([l for l in desc_lines if l.strip()]))
+    desc_lines = []
+    if row["organizer"]:
+        desc_lines.append("Organizer: " + row["organizer"])
+    if row["tour"]:
+        desc_lines.append("Tour: " + row["tour"])
+    if row["source"]:
+        desc_lines.append("Source: " + row["source"])
+    if row["source_url"]:
+        desc_lines.append("URL: " + row["source_url"])
+    lines.append("DESCRIPTION:" + ics_escape("\n".join(desc_lines)))
+
+    if row["location"]:
+        lines.append("LOCATION:" + ics_escape(row["location"]))
 
     # Also set URL if present
-    if row.get("source_url"):
-        ev.add("url", row["source_url"])
+    if row["source_url"]:
+        lines.append("URL:" + row["source_url"])
 
-    cal.add_component(ev)
+    lines.append("END:VEVENT")
+    return b"".join(fold_line(line) for line in lines)
 
 
-def main():
-    args = parse_args()
-    df = pd.read_excel(args.xlsx)
+def serialize_chunk(rows: Sequence[Dict], flags: Sequence[int]) -> List[bytes]:
+    return [render_event(row, mark_conflict=bool(c)) for row, c in zip(rows, flags)]
 
-    # Normalize rows
-    rows: List[Dict] = []
-    for _, r in df.iterrows():
-        start = to_date(r["start_date"])
-        end = to_date(r["end_date"])
-        rows.append(
-            {
-                "start": start,
-                "end": end,
-                "start_iso": str(r["start_date"]),
-                "end_iso": str(r["end_date"]),
-                "title": str(r["title"]),
-                "organizer": str(r["organizer"]),
-                "tour": "" if pd.isna(r.get("tour")) else str(r.get("tour")),
-                "location": None if pd.isna(r.get("location")) else str(r.get("location")).strip(),
-                "source": "" if pd.isna(r.get("source")) else str(r.get("source")),
-                "source_url": "" if pd.isna(r.get("source_url")) else str(r.get("source_url")),
-            }
-        )
-
-    conflict_set = build_conflict_set(rows)
 
-    cal_all = make_calendar(args.calname)
-    cal_conf = make_calendar(args.calname + " (Conflicts)")
+def serialize_events(rows: Sequence[Dict], flags: Sequence[int]) -> Iterator[bytes]:
+    """
+    Yields one serialized VEVENT per row, in order. flags[i] marks rows[i] as a conflict.
+    """
+    if len(rows) < PARALLEL_MIN_EVENTS or (os.cpu_count() or 1) <= 1:
+        for row, c in zip(rows, flags):
+            yield render_event(row, mark_conflict=bool(c))
+        return
+
+    bounds = range(0, len(rows), PARALLEL_CHUNK)
+    with ProcessPoolExecutor(max_workers=os.cpu_count()) as ex:
+        for chunk in ex.map(
+            serialize_chunk,
+            [rows[i : i + PARALLEL_CHUNK] for i in bounds],
+            [flags[i : i + PARALLEL_CHUNK] for i in bounds],
+        ):
+            yield from chunk
+
+
+def write_ics(
+    path: str, calname: str, conflicts_path: str, conflicts_calname: str, events: Iterable[bytes], flags: Sequence[int]
+) -> None:
+    """
+    Streams both calendars to disk in a single pass, one serialized VEVENT at a
+    time, never building either calendar as a single object. Every event goes to
+    the main calendar, and also to the conflicts calendar when its flag is set.
+    """
+    buf = bytearray(calendar_header(calname))
+    conflicts_buf = bytearray(calendar_header(conflicts_calname))
+    with open(path, "wb") as f, open(conflicts_path, "wb") as fc:
+        for n, (data, c) in enumerate(zip(events, flags), 1):
+            buf += data
+            if c:
+                conflicts_buf += data
+            if n % FLUSH_EVERY == 0:
+                f.write(buf)
+                buf.clear()
+                fc.write(conflicts_buf)
+                conflicts_buf.clear()
+        buf += CAL_END
+        f.write(buf)
+        conflicts_buf += CAL_END
+        fc.write(conflicts_buf)
 
-    for i, row in enumerate(rows):
-        add_event(cal_all, row, args.uid_domain, mark_conflict=(i in conflict_set))
-        if i in conflict_set:
-            add_event(cal_conf, row, args.uid_domain, mark_conflict=True)
 
-    with open(args.ics, "wb") as f:
-        f.write(cal_all.to_ical())
+def main():
+    args = parse_args()
+    rows = read_rows(args.xlsx)
 
-    with open(args.ics_conflicts, "wb") as f:
-        f.write(cal_conf.to_ical())
+    # per-row values, computed once
+    for row in rows:
+        row["uid"] = stable_uid(
+            row["organizer"], row["start_iso"], row["end_iso"], row["title"], args.uid_domain, args.uid_hash
+        )
+        row["dtstart"] = row["start"].strftime("%Y%m%d")
+        # all-day, DTEND is exclusive -> end + 1 day
+        row["dtend"] = (row["end"] + ONE_DAY).strftime("%Y%m%d")
+
+    start_ord = np.fromiter((row["start"].toordinal() for row in rows), dtype=np.int32, count=len(rows))
+    end_ord = np.fromiter((row["end"].toordinal() for row in rows), dtype=np.int32, count=len(rows))
+    conflicts = build_conflict_mask(start_ord, end_ord)
+
+    # Conflicting rows are marked the same way in both calendars: render each row once
+    write_ics(
+        args.ics,
+        args.calname,
+        args.ics_conflicts,
+        args.calname + " (Conflicts)",
+        serialize_events(rows, conflicts),
+        conflicts,
+    )
 
 
 if __name__ == "__main__":
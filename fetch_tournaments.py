@@ -4,23 +4,35 @@
 from __future__ import annotations
 
 import argparse
-import json
+import csv
 import re
+import sqlite3
 import sys
+import threading
 import time
 import unicodedata
-from dataclasses import dataclass
-from datetime import date, datetime, timedelta
-from functools import lru_cache
-from typing import Any, Dict, Iterable, List, Optional, Tuple
+from collections import defaultdict
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass, field, replace
+from datetime import date, timedelta
+from functools import lru_cache, partial, wraps
+from itertools import chain
+from operator import attrgetter
+from typing import Any, Callable, DefaultDict, Dict, Iterable, Iterator, List, Optional, Tuple
 
-import pandas as pd
 import requests
-from bs4 import BeautifulSoup
-from icalendar import Calendar
+import xlsxwriter
+from lxml import etree
+from lxml import html as lxml_html
 from requests.adapters import HTTPAdapter
+from requests_cache import CachedSession
 from urllib3.util.retry import Retry
 
+try:
+    from orjson import loads as json_loads
+except ImportError:  # orjson is optional; stdlib json parses the same documents
+    from json import loads as json_loads
+
 
 # =========================================================
 # Sources
@@ -49,11 +61,19 @@ PBS_FALLBACK_URLS = [
 
 DEFAULT_TIMEOUT = 25
 
+# Feed/page fetches are I/O-bound: they are fanned out over a shared thread pool,
+# and a semaphore caps the number of requests in flight across all callers.
+HTTP_MAX_WORKERS = 16
+
+# Feeds and pages barely change within a day: reruns are served from this cache
+HTTP_CACHE_PATH = ".http-cache.sqlite"
+HTTP_CACHE_TTL = timedelta(hours=12)
+
 
 # =========================================================
 # Model
 # =========================================================
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Tournament:
     title: str
     organizer: str
@@ -63,21 +83,31 @@ class Tournament:
     tour: Optional[str]
     source: str
     source_url: str
+    # ISO strings are formatted on first use (export, listings) and kept in these slots
+    _start_iso: Optional[str] = field(default=None, init=False, repr=False, compare=False)
+    _end_iso: Optional[str] = field(default=None, init=False, repr=False, compare=False)
 
     @property
     def start_iso(self) -> str:
-        return self.start.isoformat()
+        if self._start_iso is None:
+            object.__setattr__(self, "_start_iso", self.start.isoformat())
+        return self._start_iso
 
     @property
     def end_iso(self) -> str:
-        return self.end.isoformat()
+        if self._end_iso is None:
+            object.__setattr__(self, "_end_iso", self.end.isoformat())
+        return self._end_iso
 
 
 # =========================================================
 # HTTP
 # =========================================================
-def build_session() -> requests.Session:
-    s = requests.Session()
+def build_session(pool_size: int = HTTP_MAX_WORKERS, cache_path: Optional[str] = None) -> requests.Session:
+    if cache_path:
+        s = CachedSession(cache_path, backend="sqlite", expire_after=HTTP_CACHE_TTL, allowable_methods=("GET",))
+    else:
+        s = requests.Session()
     s.headers.update(
         {
             "User-Agent": (
@@ -97,34 +127,118 @@ def build_session() -> requests.Session:
         allowed_methods=["GET", "HEAD"],
         raise_on_status=False,
     )
-    s.mount("https://", HTTPAdapter(max_retries=retries))
-    s.mount("http://", HTTPAdapter(max_retries=retries))
+    # One keep-alive pool per host, sized so every HTTP_POOL worker can hold a connection
+    adapter = HTTPAdapter(max_retries=retries, pool_connections=32, pool_maxsize=pool_size)
+    s.mount("https://", adapter)
+    s.mount("http://", adapter)
     return s
 
 
 SESSION = build_session()
+HTTP_POOL = ThreadPoolExecutor(max_workers=HTTP_MAX_WORKERS, thread_name_prefix="http")
+_HTTP_SLOTS = threading.BoundedSemaphore(HTTP_MAX_WORKERS)
+
+
+def configure_http(n: int, cache_path: Optional[str]) -> None:
+    """
+    Resizes the fetch pool, the in-flight request cap and the connection pools
+    to n, and enables the response cache at cache_path (None = no cache).
+    Must run before any fetch is submitted.
+    """
+    global SESSION, HTTP_POOL, _HTTP_SLOTS
+    n = max(1, n)
+    HTTP_POOL.shutdown(wait=False)
+    SESSION = build_session(pool_size=n, cache_path=cache_path)
+    HTTP_POOL = ThreadPoolExecutor(max_workers=n, thread_name_prefix="http")
+    _HTTP_SLOTS = threading.BoundedSemaphore(n)
 
 
 def http_get(url: str) -> str:
-    r = SESSION.get(url, timeout=DEFAULT_TIMEOUT)
+    with _HTTP_SLOTS:
+        r = SESSION.get(url, timeout=DEFAULT_TIMEOUT)
     r.raise_for_status()
-    return r.text
+    # Like r.text, but without charset sniffing of the whole body when no charset is declared
+    try:
+        return r.content.decode(r.encoding or "utf-8", errors="replace")
+    except LookupError:  # unknown charset label
+        return r.content.decode("utf-8", errors="replace")
+
+
+def single_flight(fn: Callable[[str], Any]) -> Callable[[str], Any]:
+    """
+    Memoizes a one-argument fetcher across threads: concurrent callers asking for
+    the same URL wait on one shared future instead of each issuing the request.
+    """
+    futures: Dict[str, Future] = {}
+    lock = threading.Lock()
+
+    @wraps(fn)
+    def wrapper(url: str) -> Any:
+        with lock:
+            fut = futures.get(url)
+            owner = fut is None
+            if owner:
+                fut = futures[url] = Future()
+        if owner:
+            try:
+                fut.set_result(fn(url))
+            except BaseException as e:
+                fut.set_exception(e)
+        return fut.result()
+
+    return wrapper
 
 
 # =========================================================
 # Utils
 # =========================================================
+NON_ALNUM_RE = re.compile(r"[^a-zA-Z0-9]+")
+SHOW_POSTER_RE = re.compile(r"(?i)\bshow poster\b")
+YEAR_RE = re.compile(r"\b20\d{2}\b")
+
+
 def norm_spaces(s: str) -> str:
-    return re.sub(r"\s+", " ", (s or "").strip())
+    # str.split() breaks on the same Unicode whitespace as \s, without the regex engine
+    return " ".join(s.split()) if s else ""
 
 
+@lru_cache(maxsize=4096)
 def slug(s: str) -> str:
-    s = unicodedata.normalize("NFKD", s).encode("ascii", "ignore").decode("ascii")
-    return re.sub(r"[^a-zA-Z0-9]+", "-", s).strip("-").lower()
+    if not s.isascii():  # most titles are plain ASCII: skip the NFKD round trip
+        s = unicodedata.normalize("NFKD", s).encode("ascii", "ignore").decode("ascii")
+    return NON_ALNUM_RE.sub("-", s).strip("-").lower()
+
+
+_HTML_PARSERS = threading.local()
+_TEXT_NODES = etree.XPath(".//text()[not(ancestor::script or ancestor::style or ancestor::template)]")
+
+
+def parse_html(text: str) -> lxml_html.HtmlElement:
+    # lxml parsers must not be shared between threads; keep one per worker
+    parser = getattr(_HTML_PARSERS, "parser", None)
+    if parser is None:
+        parser = _HTML_PARSERS.parser = lxml_html.HTMLParser(encoding="utf-8")
+    try:
+        return lxml_html.document_fromstring(text.encode("utf-8"), parser=parser)
+    except etree.ParserError:  # empty document
+        return lxml_html.document_fromstring(b"<html></html>", parser=parser)
+
+
+def stripped_strings(el: lxml_html.HtmlElement) -> List[str]:
+    """
+    Text pieces of an element, stripped, blanks dropped; script/style contents are skipped.
+    """
+    return [t for t in (p.strip() for p in _TEXT_NODES(el)) if t]
 
 
-def ics_dt_to_date(x) -> date:
-    return x.date() if isinstance(x, datetime) else x
+def node_text(el: lxml_html.HtmlElement, sep: str = " ", strip: bool = True) -> str:
+    """
+    Text of an element, pieces joined by sep (stripped and without blanks when strip).
+    script/style contents are skipped.
+    """
+    if strip:
+        return sep.join(stripped_strings(el))
+    return sep.join(_TEXT_NODES(el))
 
 
 def is_upcoming_or_ongoing(start_d: date, end_d: date, from_d: date) -> bool:
@@ -133,7 +247,7 @@ def is_upcoming_or_ongoing(start_d: date, end_d: date, from_d: date) -> bool:
 
 def clean_title(s: str) -> str:
     t = norm_spaces(s)
-    t = re.sub(r"(?i)\bshow poster\b", "", t).strip()
+    t = SHOW_POSTER_RE.sub("", t).strip()
     t = norm_spaces(t)
     return t
 
@@ -141,8 +255,9 @@ def clean_title(s: str) -> str:
 # =========================================================
 # Location rules
 # =========================================================
+# One scan for: bare numbers ("00"), list/phone leftovers ("+", "•") and page chrome
 BAD_LOCATION_RE = re.compile(
-    r"(?i)\b("
+    r"(?i)^(?:\d{1,6}$|[+•])|\b("
     r"ical|outlook|export|subscribe|add to|google|calendar|share|print|download|"
     r"tickets?|prize fund|more info|read more|countdown"
     r")\b"
@@ -155,15 +270,9 @@ def is_bad_location(loc: Optional[str]) -> bool:
     s = norm_spaces(loc)
     if not s:
         return True
-    if re.fullmatch(r"\d{1,6}", s):  # "00"
-        return True
-    if BAD_LOCATION_RE.search(s):
-        return True
     if len(s) > 140:
         return True
-    if s.startswith(("+", "•")):
-        return True
-    return False
+    return BAD_LOCATION_RE.search(s) is not None
 
 
 def normalize_location(loc: Optional[str]) -> Optional[str]:
@@ -197,33 +306,37 @@ def location_precision(loc: Optional[str]) -> int:
     """
     if not loc:
         return 0
-    s = norm_spaces(loc)
-    return 2 if "," in s else 1
+    return 2 if "," in loc else 1
 
 
 # =========================================================
 # JSON-LD extraction (Event -> locality/region/country)
 # =========================================================
-def _iter_jsonld_objects(soup: BeautifulSoup) -> Iterable[Any]:
-    for script in soup.find_all("script", attrs={"type": "application/ld+json"}):
-        raw = script.string or script.get_text(strip=True)
+JSONLD_SCRIPTS = etree.XPath('//script[@type="application/ld+json"]')
+
+
+def _iter_jsonld_objects(tree: lxml_html.HtmlElement) -> Iterable[Any]:
+    for script in JSONLD_SCRIPTS(tree):
+        raw = script.text
         if not raw:
             continue
         raw = raw.strip()
         try:
-            yield json.loads(raw)
+            yield json_loads(raw)
         except Exception:
             continue
 
 
 def _walk(obj: Any) -> Iterable[Any]:
-    if isinstance(obj, dict):
-        yield obj
-        for v in obj.values():
-            yield from _walk(v)
-    elif isinstance(obj, list):
-        for it in obj:
-            yield from _walk(it)
+    # Depth-first, same order as the recursive walk, without a generator per level
+    stack = [obj]
+    while stack:
+        o = stack.pop()
+        if isinstance(o, dict):
+            yield o
+            stack.extend(reversed(o.values()))
+        elif isinstance(o, list):
+            stack.extend(reversed(o))
 
 
 def _stringify_country(x: Any) -> str:
@@ -236,11 +349,11 @@ def _stringify_country(x: Any) -> str:
     return ""
 
 
-def extract_location_from_jsonld(soup: BeautifulSoup) -> Optional[str]:
+def extract_location_from_jsonld(tree: lxml_html.HtmlElement) -> Optional[str]:
     """
     Returns "City, Region, Country" or "City, Country" when available.
     """
-    for root in _iter_jsonld_objects(soup):
+    for root in _iter_jsonld_objects(tree):
         for d in _walk(root):
             if not isinstance(d, dict):
                 continue
@@ -284,63 +397,153 @@ def extract_location_from_jsonld(soup: BeautifulSoup) -> Optional[str]:
     return None
 
 
+# =========================================================
+# Persistent location cache (detail page URL -> location)
+# =========================================================
+LOCATION_CACHE_TTL_S = 7 * 86400
+# Pages without a usable location yet (often "TBA") are re-read on the next daily run
+LOCATION_CACHE_MISS_TTL_S = 12 * 3600
+
+_LOCATION_DB: Optional[sqlite3.Connection] = None
+_LOCATION_DB_LOCK = threading.Lock()
+
+
+def open_location_cache(path: str) -> None:
+    global _LOCATION_DB
+    db = sqlite3.connect(path, check_same_thread=False, isolation_level=None)
+    db.execute(
+        "CREATE TABLE IF NOT EXISTS locations (url TEXT PRIMARY KEY, fetched_at INTEGER NOT NULL, location TEXT)"
+    )
+    _LOCATION_DB = db
+
+
+def cached_location(url: str) -> Tuple[bool, Optional[str]]:
+    """
+    (hit, location). Entries older than LOCATION_CACHE_TTL_S (LOCATION_CACHE_MISS_TTL_S
+    for pages that had no location) are misses.
+    """
+    if _LOCATION_DB is None:
+        return False, None
+    with _LOCATION_DB_LOCK:
+        row = _LOCATION_DB.execute("SELECT fetched_at, location FROM locations WHERE url = ?", (url,)).fetchone()
+    if row is None:
+        return False, None
+    ttl = LOCATION_CACHE_TTL_S if row[1] is not None else LOCATION_CACHE_MISS_TTL_S
+    if time.time() - row[0] >= ttl:
+        return False, None
+    return True, row[1]
+
+
+def store_location(url: str, loc: Optional[str]) -> None:
+    if _LOCATION_DB is None:
+        return
+    with _LOCATION_DB_LOCK:
+        _LOCATION_DB.execute(
+            "INSERT OR REPLACE INTO locations (url, fetched_at, location) VALUES (?, ?, ?)",
+            (url, int(time.time()), loc),
+        )
+
+
 # =========================================================
 # Generic page location extraction (WPA/Matchroom/EPBF detail)
 # =========================================================
-@lru_cache(maxsize=1024)
+def _css_class(name: str) -> str:
+    return f"contains(concat(' ', normalize-space(@class), ' '), ' {name} ')"
+
+
+# MEC / common location selectors, as XPath (first match in document order):
+#   .mec-single-event .mec-event-location, .mec-single-event-location,
+#   .mec-event-meta-item-location, .mec-event-meta .mec-event-location,
+#   .mec-event-location, i.mec-sl-location, i.mec-fa-map-marker, i.fa-map-marker
+LOCATION_XPATHS = [
+    etree.XPath(f"(//*[{_css_class('mec-single-event')}]//*[{_css_class('mec-event-location')}])[1]"),
+    etree.XPath(f"(//*[{_css_class('mec-single-event-location')}])[1]"),
+    etree.XPath(f"(//*[{_css_class('mec-event-meta-item-location')}])[1]"),
+    etree.XPath(f"(//*[{_css_class('mec-event-meta')}]//*[{_css_class('mec-event-location')}])[1]"),
+    etree.XPath(f"(//*[{_css_class('mec-event-location')}])[1]"),
+    etree.XPath(f"(//i[{_css_class('mec-sl-location')}])[1]"),
+    etree.XPath(f"(//i[{_css_class('mec-fa-map-marker')}])[1]"),
+    etree.XPath(f"(//i[{_css_class('fa-map-marker')}])[1]"),
+]
+
+
+LOCATION_LABEL_RE = re.compile(r"(?i)^(location|venue)\s*[:\-]?\s*")
+LOCATION_LINE_RE = re.compile(r"(?im)^\s*(location|venue)\s*[:\-]\s*(.+?)\s*$")
+
+
+@single_flight
 def fetch_location_from_page(url: str) -> Optional[str]:
+    hit, loc = cached_location(url)
+    if hit:
+        return loc
+
     try:
         html = http_get(url)
     except Exception:
-        return None
+        return None  # not cached: retry on the next run
+
+    loc = extract_location_from_html(html)
+    store_location(url, loc)
+    return loc
 
-    soup = BeautifulSoup(html, "lxml")
+
+def extract_location_from_html(html: str) -> Optional[str]:
+    tree = parse_html(html)
 
     # 1) JSON-LD (best)
-    loc = extract_location_from_jsonld(soup)
+    loc = extract_location_from_jsonld(tree)
     if loc:
         return loc
 
     # 2) MEC / common selectors
-    selectors = [
-        ".mec-single-event .mec-event-location",
-        ".mec-single-event-location",
-        ".mec-event-meta-item-location",
-        ".mec-event-meta .mec-event-location",
-        ".mec-event-location",
-        "i.mec-sl-location",
-        "i.mec-fa-map-marker",
-        "i.fa-map-marker",
-    ]
-
-    for sel in selectors:
-        el = soup.select_one(sel)
-        if not el:
+    for sel in LOCATION_XPATHS:
+        found = sel(tree)
+        if not found:
             continue
+        el = found[0]
 
-        if el.name == "i":
-            parent = el.parent
-            if parent:
-                cand = norm_spaces(parent.get_text(" ", strip=True))
+        if el.tag == "i":
+            parent = el.getparent()
+            if parent is not None:
+                cand = norm_spaces(node_text(parent))
             else:
                 continue
         else:
-            cand = norm_spaces(el.get_text(" ", strip=True))
+            cand = norm_spaces(node_text(el))
 
-        cand = re.sub(r"(?i)^(location|venue)\s*[:\-]?\s*", "", cand).strip()
+        cand = LOCATION_LABEL_RE.sub("", cand).strip()
         cand = normalize_location(cand)
         if cand:
             return cand
 
     # 3) Text label fallback
-    text = soup.get_text("\n")
-    m = re.search(r"(?im)^\s*(location|venue)\s*[:\-]\s*(.+?)\s*$", text)
+    text = node_text(tree, "\n", strip=False)
+    m = LOCATION_LINE_RE.search(text)
     if m:
         return normalize_location(m.group(2))
 
     return None
 
 
+def fetch_locations(
+    urls: Iterable[str], sleep_s: float, fetch: Callable[[str], Optional[str]]
+) -> Dict[str, Optional[str]]:
+    """
+    Resolves the location of many detail pages concurrently on HTTP_POOL.
+    sleep_s is applied after each page fetch in the worker that made it, so the
+    aggregate request rate scales with --concurrency.
+    """
+
+    def one(url: str) -> Optional[str]:
+        loc = fetch(url)
+        if sleep_s > 0:
+            time.sleep(sleep_s)
+        return loc
+
+    unique = list(dict.fromkeys(urls))
+    return dict(zip(unique, HTTP_POOL.map(one, unique)))
+
+
 # =========================================================
 # Matchroom schedule fallback (STRICT, no title-as-location)
 # =========================================================
@@ -370,26 +573,32 @@ MATCHROOM_STOPWORDS = {
 }
 
 
+TRAILING_PUNCT_RE = re.compile(r"[^\wÀ-ÿ'\- ]+$")
+PRIZE_FUND_RE = re.compile(r"(?i)\bprize fund\b")
+MATCHROOM_EVENT_WORD_RE = re.compile(r"(?i)\b(wnt|open|championship|cup|legends|pool|premier|league)\b")
+MATCHROOM_VENUE_WORD_RE = re.compile(r"(?i)\b(arena|hotel|resort|centre|center|club|hall)\b")
+
+
 def _extract_tail_place_words(segment: str, max_words: int = 3) -> str:
-    seg = norm_spaces(segment)
-    seg = re.sub(r"[^\wÀ-ÿ'\- ]+$", "", seg).strip()
-    words = [w for w in seg.split(" ") if w]
+    words = TRAILING_PUNCT_RE.sub("", norm_spaces(segment)).split()
     picked: List[str] = []
-    for w in reversed(words):
-        wl = w.lower().strip(".,()")
-        if re.fullmatch(r"\d{1,4}", wl):
+    i = len(words)
+    while i and len(picked) < max_words:
+        i -= 1
+        w = words[i].strip(".,()")
+        wl = w.lower()
+        if len(wl) <= 4 and wl.isdecimal():
             continue
         if wl in MATCHROOM_STOPWORDS:
             break
-        picked.append(w.strip(".,()"))
-        if len(picked) >= max_words:
-            break
-    return norm_spaces(" ".join(reversed(picked)))
+        picked.append(w)
+    picked.reverse()
+    return norm_spaces(" ".join(picked))
 
 
 def parse_location_from_matchroom_title(title: str) -> Optional[str]:
     t = norm_spaces(title)
-    t = re.split(r"(?i)\bprize fund\b", t)[0].strip()
+    t = PRIZE_FUND_RE.split(t)[0].strip()
     if "," not in t:
         return None
 
@@ -414,59 +623,129 @@ def matchroom_location_is_suspicious(loc: Optional[str]) -> bool:
     if not loc:
         return True
     s = norm_spaces(loc)
-    if re.search(r"(?i)\b(wnt|open|championship|cup|legends|pool|premier|league)\b", s):
-        if not re.search(r"(?i)\b(arena|hotel|resort|centre|center|club|hall)\b", s):
+    if MATCHROOM_EVENT_WORD_RE.search(s):
+        if not MATCHROOM_VENUE_WORD_RE.search(s):
             return True
     if len(s) > 80:
         return True
     return False
 
 
+# =========================================================
+# Minimal iCalendar reader (only what the WPA feeds need)
+# =========================================================
+ICS_ESCAPE_RE = re.compile(r"\\([\\;,nN])")
+ICS_UNESCAPED = {"\\": "\\", ";": ";", ",": ",", "n": "\n", "N": "\n"}
+
+
+def ics_unescape(value: str) -> str:
+    return ICS_ESCAPE_RE.sub(lambda m: ICS_UNESCAPED[m.group(1)], value)
+
+
+def _split_content_line(line: str) -> Tuple[str, str]:
+    """
+    "NAME;PARAM=...:value" -> ("NAME", "value"). Colons inside quoted
+    parameter values (TZID="...") do not end the name part.
+    """
+    quoted = False
+    for i, ch in enumerate(line):
+        if ch == '"':
+            quoted = not quoted
+        elif ch == ":" and not quoted:
+            return line[:i].split(";", 1)[0].upper(), line[i + 1 :]
+    raise ValueError(f"Content line has no value: {line[:60]!r}")
+
+
+def unfold_lines(lines: Iterable[str]) -> Iterator[str]:
+    """
+    Joins folded continuation lines (leading space/tab) onto the previous
+    content line; blank lines are dropped.
+    """
+    current: Optional[str] = None
+    for raw in lines:
+        line = raw.rstrip("\r")
+        if not line:
+            continue
+        if current is not None and line[0] in " \t":
+            current += line[1:]
+            continue
+        if current is not None:
+            yield current
+        current = line
+    if current is not None:
+        yield current
+
+
+def iter_vevents(lines: Iterable[str]) -> Iterator[Dict[str, str]]:
+    """
+    Yields each VEVENT of an iCalendar stream (raw lines, folded or not) as
+    {PROPERTY: unescaped value}, parameters dropped and the first occurrence
+    of a property kept. Properties of nested components (VALARM...) are skipped.
+    """
+    event: Optional[Dict[str, str]] = None
+    depth = 0
+    header_seen = False
+    for line in unfold_lines(lines):
+        if not header_seen:
+            if line.lstrip("\ufeff").upper() != "BEGIN:VCALENDAR":
+                raise ValueError("Not an iCalendar feed")
+            header_seen = True
+            continue
+        name, value = _split_content_line(line)
+        if name == "BEGIN":
+            if event is not None:
+                depth += 1
+            elif value.upper() == "VEVENT":
+                event = {}
+        elif name == "END":
+            if event is None:
+                continue
+            if depth:
+                depth -= 1
+            else:
+                yield event
+                event = None
+        elif event is not None and not depth and name not in event:
+            event[name] = ics_unescape(value)
+
+
+def ics_date(value: str) -> date:
+    # DATE or DATE-TIME (floating, UTC or TZID): the calendar day is the first 8 digits
+    return date(int(value[0:4]), int(value[4:6]), int(value[6:8]))
+
+
 # =========================================================
 # WPA detail URL extraction from ICS
 # =========================================================
 URL_RE = re.compile(r"https?://[^\s)>\"]+")
 
 
-def extract_detail_url_from_ical(comp) -> Optional[str]:
-    for k in ("url", "URL"):
-        v = comp.get(k)
-        if v:
-            vv = norm_spaces(str(v))
-            if vv.startswith(("http://", "https://")):
-                return vv
-
-    for k in ("uid", "UID"):
-        v = comp.get(k)
-        if v:
-            vv = norm_spaces(str(v))
-            if vv.startswith(("http://", "https://")):
-                return vv
+def extract_detail_url_from_ical(ev: Dict[str, str]) -> Optional[str]:
+    # MEC feeds almost always carry the event page as URL
+    for k in ("URL", "UID"):
+        v = ev.get(k)
+        if v and (vv := v.strip()).startswith(("http://", "https://")):
+            return norm_spaces(vv)
 
-    desc = comp.get("description") or ""
-    m = URL_RE.search(str(desc))
-    if m:
+    desc = ev.get("DESCRIPTION")
+    if desc and (m := URL_RE.search(desc)):
         return m.group(0)
 
-    try:
-        for _, val in comp.property_items():
-            s = str(val)
-            m2 = URL_RE.search(s)
-            if m2:
-                u = m2.group(0)
-                if u.startswith(("http://", "https://")):
-                    return u
-    except Exception:
-        pass
+    for k, val in ev.items():
+        if k != "DESCRIPTION" and (m := URL_RE.search(val)):
+            return m.group(0)
 
     return None
 
 
+WPA_DESCRIPTION_LOCATION_RE = re.compile(r"(?im)^\s*location\s*:\s*(.+?)\s*$")
+
+
 def parse_wpa_location_from_description(desc: Optional[str]) -> Optional[str]:
     if not desc:
         return None
     txt = str(desc).replace("\r", "\n")
-    m = re.search(r"(?im)^\s*location\s*:\s*(.+?)\s*$", txt)
+    m = WPA_DESCRIPTION_LOCATION_RE.search(txt)
     if not m:
         return None
     return normalize_location(m.group(1))
@@ -506,18 +785,25 @@ MONTH_FULL = {
 }
 
 
+EPBF_SAME_MONTH_RE = re.compile(r"^(\d{1,2})-(\d{1,2}) ([a-z]{3,4})$")
+EPBF_CROSS_MONTH_RE = re.compile(r"^(\d{1,2}) ([a-z]{3,4}) - (\d{1,2}) ([a-z]{3,4})$")
+EPBF_CROSS_MONTH_SPAN_RE = re.compile(r"^(\d{1,2}) ([a-z]{3,4}) - (\d{1,2})-(\d{1,2}) ([a-z]{3,4})$")
+MATCHROOM_SAME_MONTH_RE = re.compile(r"^([A-Za-z]+) (\d{1,2}) - (\d{1,2}) (\d{4})$")
+MATCHROOM_CROSS_MONTH_RE = re.compile(r"^([A-Za-z]+) (\d{1,2}) - ([A-Za-z]+) (\d{1,2}) (\d{4})$")
+
+
 def parse_epbf_date_range(raw: str, year: int) -> Tuple[date, date]:
     s = norm_spaces(raw.lower().replace("–", "-"))
-    m = re.match(r"^(\d{1,2})-(\d{1,2}) ([a-z]{3,4})$", s)
+    m = EPBF_SAME_MONTH_RE.match(s)
     if m:
         d1, d2, mon = int(m.group(1)), int(m.group(2)), m.group(3)
         return date(year, MONTH_ABBR[mon], d1), date(year, MONTH_ABBR[mon], d2)
-    m = re.match(r"^(\d{1,2}) ([a-z]{3,4}) - (\d{1,2}) ([a-z]{3,4})$", s)
+    m = EPBF_CROSS_MONTH_RE.match(s)
     if m:
         d1, mon1 = int(m.group(1)), m.group(2)
         d2, mon2 = int(m.group(3)), m.group(4)
         return date(year, MONTH_ABBR[mon1], d1), date(year, MONTH_ABBR[mon2], d2)
-    m = re.match(r"^(\d{1,2}) ([a-z]{3,4}) - (\d{1,2})-(\d{1,2}) ([a-z]{3,4})$", s)
+    m = EPBF_CROSS_MONTH_SPAN_RE.match(s)
     if m:
         d1, mon1 = int(m.group(1)), m.group(2)
         d3, mon2 = int(m.group(4)), m.group(5)
@@ -527,11 +813,11 @@ def parse_epbf_date_range(raw: str, year: int) -> Tuple[date, date]:
 
 def parse_matchroom_date_range(raw: str) -> Tuple[date, date, int]:
     s = norm_spaces(raw.replace("–", "-").replace("—", "-"))
-    m = re.match(r"^([A-Za-z]+) (\d{1,2}) - (\d{1,2}) (\d{4})$", s)
+    m = MATCHROOM_SAME_MONTH_RE.match(s)
     if m:
         mon, d1, d2, y = m.group(1).lower(), int(m.group(2)), int(m.group(3)), int(m.group(4))
         return date(y, MONTH_FULL[mon], d1), date(y, MONTH_FULL[mon], d2), y
-    m = re.match(r"^([A-Za-z]+) (\d{1,2}) - ([A-Za-z]+) (\d{1,2}) (\d{4})$", s)
+    m = MATCHROOM_CROSS_MONTH_RE.match(s)
     if m:
         mon1, d1 = m.group(1).lower(), int(m.group(2))
         mon2, d2 = m.group(3).lower(), int(m.group(4))
@@ -543,80 +829,90 @@ def parse_matchroom_date_range(raw: str) -> Tuple[date, date, int]:
 # =========================================================
 # Fetchers
 # =========================================================
+def fetch_ics_events(url: str) -> List[Dict[str, str]]:
+    # split on "\n" only: "\r" is left to the tokenizer, U+2028 etc. inside values stay intact
+    return list(iter_vevents(http_get(url).split("\n")))
+
+
 def fetch_wpa_ics(from_d: date, enrich_limit: int, sleep_s: float) -> List[Tournament]:
     out: List[Tournament] = []
-    enrich_count = 0
+    # Each feed is streamed and tokenized on HTTP_POOL
+    feeds = [(label, feed_url, HTTP_POOL.submit(fetch_ics_events, feed_url)) for label, feed_url in WPA_FEEDS.items()]
 
-    for label, feed_url in WPA_FEEDS.items():
+    # (summary, start, end, location, detail_url, label, feed_url)
+    pending: List[Tuple[str, date, date, Optional[str], Optional[str], str, str]] = []
+    for label, feed_url, fut in feeds:
         try:
-            ics_text = http_get(feed_url)
-            cal = Calendar.from_ical(ics_text)
-
-            for comp in cal.walk():
-                if comp.name != "VEVENT":
+            for ev in fut.result():
+                # Dates first: most of a full-history feed is past events
+                dtstart = ev.get("DTSTART")
+                if not dtstart:
                     continue
+                start_d = ics_date(dtstart)
+                dtend = ev.get("DTEND")
+                end_d = start_d if not dtend else (ics_date(dtend) - timedelta(days=1))
 
-                summary = clean_title(norm_spaces(str(comp.get("summary", ""))))
-                if not summary:
+                if not is_upcoming_or_ongoing(start_d, end_d, from_d):
                     continue
 
-                start_d = ics_dt_to_date(comp.get("dtstart").dt)
-                dtend = comp.get("dtend").dt if comp.get("dtend") else None
-                end_d = start_d if dtend is None else (ics_dt_to_date(dtend) - timedelta(days=1))
-
-                if not is_upcoming_or_ongoing(start_d, end_d, from_d):
+                summary = clean_title(norm_spaces(ev.get("SUMMARY", "")))
+                if not summary:
                     continue
 
-                detail_url = extract_detail_url_from_ical(comp)
+                detail_url = extract_detail_url_from_ical(ev)
 
-                loc = normalize_location(norm_spaces(str(comp.get("location", ""))))
+                loc = normalize_location(norm_spaces(ev.get("LOCATION", "")))
                 if not loc:
-                    loc = parse_wpa_location_from_description(comp.get("description"))
+                    loc = parse_wpa_location_from_description(ev.get("DESCRIPTION"))
 
-                if not loc and detail_url and enrich_count < enrich_limit:
-                    cand = fetch_location_from_page(detail_url)
-                    loc = normalize_location(cand)
-                    enrich_count += 1
-                    if sleep_s > 0:
-                        time.sleep(sleep_s)
-
-                out.append(
-                    Tournament(
-                        title=summary,
-                        organizer="WPA",
-                        start=start_d,
-                        end=end_d,
-                        location=loc,
-                        tour=label,
-                        source="WPA iCal feed",
-                        source_url=feed_url,
-                    )
-                )
+                pending.append((summary, start_d, end_d, loc, detail_url, label, feed_url))
 
         except Exception as e:
             print(f"[WARN] WPA feed failed {label}: {e}", file=sys.stderr)
 
+    # Event pages for the first enrich_limit events still lacking a location, fetched concurrently
+    to_enrich = [p[4] for p in pending if not p[3] and p[4]][:enrich_limit]
+    found = fetch_locations(to_enrich, sleep_s, fetch_location_from_page)
+
+    for summary, start_d, end_d, loc, detail_url, label, feed_url in pending:
+        if not loc and detail_url in found:
+            loc = normalize_location(found[detail_url])
+
+        out.append(
+            Tournament(
+                title=summary,
+                organizer="WPA",
+                start=start_d,
+                end=end_d,
+                location=loc,
+                tour=label,
+                source="WPA iCal feed",
+                source_url=feed_url,
+            )
+        )
+
     return out
 
 
+# "<Month> d - d yyyy <rest>" or "<Month> d - <Month> d yyyy <rest>", on space-normalized text
+MATCHROOM_ROW_RE = re.compile(
+    r"^((?:January|February|March|April|May|June|July|August|September|October|November|December)"
+    r" \d{1,2} [-–—] (?:[A-Za-z]+ )?\d{1,2} 20\d{2})\s+(.*)$"
+)
+MATCHROOM_EVENT_TYPE_RE = re.compile(r"^(Ranking|Major|Non-Ranking|Junior|Blue Ribbon)\s+(.*)$")
+
+
 def fetch_matchroom(from_d: date, enrich_limit: int, sleep_s: float) -> List[Tournament]:
     html = http_get(MATCHROOM_SCHEDULE_URL)
-    soup = BeautifulSoup(html, "lxml")
+    tree = parse_html(html)
 
     out: List[Tournament] = []
-    enrich_count = 0
-
-    for a in soup.find_all("a"):
-        txt = norm_spaces(a.get_text(" ", strip=True))
-        if not txt or not re.search(r"\b20\d{2}\b", txt):
-            continue
-        if not re.match(
-            r"^(January|February|March|April|May|June|July|August|September|October|November|December)\b",
-            txt,
-        ):
-            continue
+    # (title, start, end, event_type, href)
+    pending: List[Tuple[str, date, date, Optional[str], str]] = []
 
-        m = re.match(r"^(.+?\b20\d{2}\b)\s+(.*)$", txt)
+    for a in tree.iter("a"):
+        txt = norm_spaces(node_text(a))
+        m = MATCHROOM_ROW_RE.match(txt)
         if not m:
             continue
 
@@ -630,7 +926,7 @@ def fetch_matchroom(from_d: date, enrich_limit: int, sleep_s: float) -> List[Tou
             continue
 
         event_type = None
-        m2 = re.match(r"^(Ranking|Major|Non-Ranking|Junior|Blue Ribbon)\s+(.*)$", rest)
+        m2 = MATCHROOM_EVENT_TYPE_RE.match(rest)
         if m2:
             event_type = m2.group(1)
             title = clean_title(m2.group(2).strip())
@@ -641,14 +937,16 @@ def fetch_matchroom(from_d: date, enrich_limit: int, sleep_s: float) -> List[Tou
         if not href.startswith("http"):
             href = f"https://matchroompool.com{href}"
 
+        pending.append((title, start_d, end_d, event_type, href))
+
+    # Event pages of the first enrich_limit rows, fetched concurrently
+    found = fetch_locations([p[4] for p in pending[:enrich_limit]], sleep_s, fetch_location_from_page)
+
+    for title, start_d, end_d, event_type, href in pending:
         loc: Optional[str] = None
 
-        if enrich_count < enrich_limit:
-            cand = fetch_location_from_page(href)
-            cand = normalize_location(cand)
-            enrich_count += 1
-            if sleep_s > 0:
-                time.sleep(sleep_s)
+        if href in found:
+            cand = normalize_location(found[href])
             if cand and not matchroom_location_is_suspicious(cand):
                 loc = cand
 
@@ -674,11 +972,14 @@ def fetch_matchroom(from_d: date, enrich_limit: int, sleep_s: float) -> List[Tou
     return out
 
 
-def find_epbf_table_columns(table: BeautifulSoup) -> Optional[Dict[str, int]]:
-    header_tr = table.find("tr")
-    if not header_tr:
+TABLE_CELLS = etree.XPath(".//th | .//td")
+
+
+def find_epbf_table_columns(table: lxml_html.HtmlElement) -> Optional[Dict[str, int]]:
+    header_tr = next(table.iter("tr"), None)
+    if header_tr is None:
         return None
-    headers = [norm_spaces(th.get_text(" ", strip=True)).lower() for th in header_tr.find_all(["th", "td"])]
+    headers = [norm_spaces(node_text(th)).lower() for th in TABLE_CELLS(header_tr)]
     if not headers:
         return None
 
@@ -699,9 +1000,12 @@ def find_epbf_table_columns(table: BeautifulSoup) -> Optional[Dict[str, int]]:
     return {"date": i_date, "title": i_title, "loc": i_loc if i_loc is not None else 2}
 
 
+NON_PAGE_LINK_RE = re.compile(r"(?i)\.(pdf|jpg|jpeg|png|webp)$")
+
+
 @lru_cache(maxsize=256)
 def fetch_epbf_location_from_link(url: str) -> Optional[str]:
-    if re.search(r"(?i)\.(pdf|jpg|jpeg|png|webp)$", url):
+    if NON_PAGE_LINK_RE.search(url):
         return None
     return normalize_location(fetch_location_from_page(url))
 
@@ -709,12 +1013,13 @@ def fetch_epbf_location_from_link(url: str) -> Optional[str]:
 def fetch_epbf(year: int, from_d: date, enrich_limit: int, sleep_s: float) -> List[Tournament]:
     url = EPBF_CALENDAR_YEAR_URL.format(year=year)
     html = http_get(url)
-    soup = BeautifulSoup(html, "lxml")
+    tree = parse_html(html)
 
     out: List[Tournament] = []
-    enrich_count = 0
+    # (title, start, end, location, link_url)
+    pending: List[Tuple[str, date, date, Optional[str], Optional[str]]] = []
 
-    tables = soup.find_all("table")
+    tables = list(tree.iter("table"))
     if not tables:
         return out
 
@@ -723,21 +1028,16 @@ def fetch_epbf(year: int, from_d: date, enrich_limit: int, sleep_s: float) -> Li
         if not colmap:
             continue
 
-        rows = table.find_all("tr")
+        rows = list(table.iter("tr"))
         for tr in rows[1:]:
-            tds = tr.find_all(["td", "th"])
+            tds = TABLE_CELLS(tr)
             if not tds or len(tds) <= colmap["title"]:
                 continue
 
-            raw_date = norm_spaces(tds[colmap["date"]].get_text(" ", strip=True)) if len(tds) > colmap["date"] else ""
+            raw_date = norm_spaces(node_text(tds[colmap["date"]])) if len(tds) > colmap["date"] else ""
             if not raw_date:
                 continue
 
-            title_cell = tds[colmap["title"]]
-            title = clean_title(title_cell.get_text(" ", strip=True))
-            if not title:
-                continue
-
             try:
                 start_d, end_d = parse_epbf_date_range(raw_date, year=year)
             except Exception:
@@ -746,44 +1046,53 @@ def fetch_epbf(year: int, from_d: date, enrich_limit: int, sleep_s: float) -> Li
             if not is_upcoming_or_ongoing(start_d, end_d, from_d):
                 continue
 
+            title_cell = tds[colmap["title"]]
+            title = clean_title(node_text(title_cell))
+            if not title:
+                continue
+
             loc_raw = ""
             if colmap["loc"] is not None and len(tds) > colmap["loc"]:
-                loc_raw = norm_spaces(tds[colmap["loc"]].get_text(" ", strip=True))
+                loc_raw = norm_spaces(node_text(tds[colmap["loc"]]))
             loc = normalize_location(loc_raw)
 
             link_url = None
-            for a in title_cell.find_all("a"):
+            for a in title_cell.iter("a"):
                 href = (a.get("href") or "").strip()
                 if not href:
                     continue
                 if href.startswith("/"):
                     href = f"https://www.epbf.com{href}"
-                if re.search(r"(?i)\.(pdf|jpg|jpeg|png|webp)$", href):
+                if NON_PAGE_LINK_RE.search(href):
                     continue
                 if "epbf.com" in href:
                     link_url = href
                     break
 
-            if (location_precision(loc) <= 1) and link_url and enrich_count < enrich_limit:
-                cand = fetch_epbf_location_from_link(link_url)
-                if cand and location_precision(cand) > location_precision(loc):
-                    loc = cand
-                enrich_count += 1
-                if sleep_s > 0:
-                    time.sleep(sleep_s)
-
-            out.append(
-                Tournament(
-                    title=title,
-                    organizer="EPBF",
-                    start=start_d,
-                    end=end_d,
-                    location=loc,
-                    tour="EPBF Calendar",
-                    source="EPBF calendar table",
-                    source_url=url,
-                )
+            pending.append((title, start_d, end_d, loc, link_url))
+
+    # Internal pages of the first enrich_limit rows lacking a precise location, fetched concurrently
+    to_enrich = [p[4] for p in pending if location_precision(p[3]) <= 1 and p[4]][:enrich_limit]
+    found = fetch_locations(to_enrich, sleep_s, fetch_epbf_location_from_link)
+
+    for title, start_d, end_d, loc, link_url in pending:
+        if location_precision(loc) <= 1 and link_url in found:
+            cand = found[link_url]
+            if cand and location_precision(cand) > location_precision(loc):
+                loc = cand
+
+        out.append(
+            Tournament(
+                title=title,
+                organizer="EPBF",
+                start=start_d,
+                end=end_d,
+                location=loc,
+                tour="EPBF Calendar",
+                source="EPBF calendar table",
+                source_url=url,
             )
+        )
 
     return out
 
@@ -852,6 +1161,9 @@ def pbs_stop_to_location(stop_name: str) -> Optional[str]:
     return normalize_location(s)
 
 
+PBS_STOP_HEADER_RE = re.compile(r"^(20\d{2})\s+(.*)$")
+
+
 def fetch_pbs_official(from_d: date) -> List[Tournament]:
     """
     Scrapes PBS /events/ page and extracts tournaments per stop.
@@ -867,10 +1179,10 @@ def fetch_pbs_official(from_d: date) -> List[Tournament]:
     out: List[Tournament] = []
 
     html = http_get(PBS_EVENTS_URL)
-    soup = BeautifulSoup(html, "lxml")
+    tree = parse_html(html)
 
-    main = soup.find("main") or soup
-    tokens = [norm_spaces(t) for t in main.stripped_strings if norm_spaces(t)]
+    main = next(tree.iter("main"), tree)
+    tokens = [norm_spaces(t) for t in stripped_strings(main) if norm_spaces(t)]
 
     in_upcoming = False
     current_stop: Optional[str] = None
@@ -894,7 +1206,7 @@ def fetch_pbs_official(from_d: date) -> List[Tournament]:
             continue
 
         # Stop header like "2026 Las Vegas"
-        m_stop = re.match(r"^(20\d{2})\s+(.*)$", tok)
+        m_stop = PBS_STOP_HEADER_RE.match(tok)
         if m_stop:
             current_stop = m_stop.group(2).strip()
             current_loc = pbs_stop_to_location(current_stop)
@@ -965,6 +1277,15 @@ def fetch_pbs_official(from_d: date) -> List[Tournament]:
 # =========================================================
 # PBS fallback (articles)
 # =========================================================
+PBS_FALLBACK_DATE_RE = re.compile(
+    r"^(?P<mon1>Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Sept|Oct|Nov|Dec)\s+"
+    r"(?P<d1>\d{1,2})\s*-\s*"
+    r"(?:(?P<mon2>Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Sept|Oct|Nov|Dec)\s+)?"
+    r"(?P<d2>\d{1,2})$",
+    re.IGNORECASE,
+)
+
+
 def fetch_pbs_fallback(from_d: date) -> List[Tournament]:
     out: List[Tournament] = []
 
@@ -977,14 +1298,6 @@ def fetch_pbs_fallback(from_d: date) -> List[Tournament]:
             .replace("—", "-")
         )
 
-    date_rx = re.compile(
-        r"^(?P<mon1>Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Sept|Oct|Nov|Dec)\s+"
-        r"(?P<d1>\d{1,2})\s*-\s*"
-        r"(?:(?P<mon2>Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Sept|Oct|Nov|Dec)\s+)?"
-        r"(?P<d2>\d{1,2})$",
-        re.IGNORECASE,
-    )
-
     def mon_to_int(mon: str) -> int:
         m = (mon or "").strip().lower()
         if m == "sept":
@@ -998,8 +1311,7 @@ def fetch_pbs_fallback(from_d: date) -> List[Tournament]:
             print(f"[WARN] PBS fallback URL failed: {url}: {e}", file=sys.stderr)
             continue
 
-        soup = BeautifulSoup(html, "lxml")
-        text = soup.get_text("\n")
+        text = node_text(parse_html(html), "\n", strip=False)
 
         lines: List[str] = []
         for raw in text.splitlines():
@@ -1014,7 +1326,7 @@ def fetch_pbs_fallback(from_d: date) -> List[Tournament]:
         prev_location: Optional[str] = None
 
         for s in lines:
-            m = date_rx.match(s)
+            m = PBS_FALLBACK_DATE_RE.match(s)
             if m:
                 if not prev_location:
                     continue
@@ -1056,14 +1368,14 @@ def choose_better(a: Tournament, b: Tournament) -> Tournament:
         return a
 
     if not a.location and b.location:
-        return Tournament(**{**a.__dict__, "location": b.location})
+        return replace(a, location=b.location)
     return a
 
 
 def dedup(tournaments: List[Tournament]) -> List[Tournament]:
-    seen: Dict[str, Tournament] = {}
+    seen: Dict[Tuple[str, date], Tournament] = {}
     for t in tournaments:
-        key = f"{slug(t.title)}|{t.start_iso}"
+        key = (slug(t.title), t.start)
         if key not in seen:
             seen[key] = t
         else:
@@ -1071,43 +1383,58 @@ def dedup(tournaments: List[Tournament]) -> List[Tournament]:
     return list(seen.values())
 
 
-def title_tokens(s: str) -> set[str]:
-    t = re.sub(r"\b20\d{2}\b", " ", s)
+@lru_cache(maxsize=4096)
+def title_tokens(s: str) -> frozenset[str]:
+    t = YEAR_RE.sub(" ", s)
     toks = [x for x in slug(t).split("-") if len(x) >= 3]
-    return set(toks)
+    return frozenset(toks)
 
 
-def jaccard(a: str, b: str) -> float:
-    sa = title_tokens(a)
-    sb = title_tokens(b)
-    if not sa or not sb:
+def token_bits(tokens: Iterable[str], token_ids: Dict[str, int]) -> int:
+    """
+    Token set as an int bitmap, assigning ids to new tokens in token_ids.
+    """
+    bits = 0
+    for tok in tokens:
+        bits |= 1 << token_ids.setdefault(tok, len(token_ids))
+    return bits
+
+
+def jaccard(a: int, b: int) -> float:
+    """
+    Jaccard similarity of two token bitmaps (see token_bits).
+    """
+    if not a or not b:
         return 0.0
-    return len(sa & sb) / len(sa | sb)
+    return (a & b).bit_count() / (a | b).bit_count()
 
 
 def cross_fill_locations(tournaments: List[Tournament]) -> List[Tournament]:
-    by_start: Dict[date, List[Tournament]] = {}
+    # Only city-level locations (precision 2) are worth copying: index just those
+    donors: DefaultDict[date, List[Tournament]] = defaultdict(list)
+    prec: Dict[int, int] = {}
+    bits: Dict[int, int] = {}
+    token_ids: Dict[str, int] = {}
     for t in tournaments:
-        by_start.setdefault(t.start, []).append(t)
+        prec[id(t)] = p = location_precision(t.location)
+        if p == 2:
+            donors[t.start].append(t)
+        bits[id(t)] = token_bits(title_tokens(t.title), token_ids)
 
     updated: List[Tournament] = []
     for t in tournaments:
-        if location_precision(t.location) == 2:
+        if prec[id(t)] == 2:
             updated.append(t)
             continue
 
-        cands = by_start.get(t.start, [])
+        toks = bits[id(t)]
         best_loc: Optional[str] = None
         best_score = 0.0
 
-        for c in cands:
-            if c is t:
-                continue
-            if location_precision(c.location) != 2:
-                continue
+        for c in donors.get(t.start, ()):
             if abs((c.end - t.end).days) > 1:
                 continue
-            sim = jaccard(t.title, c.title)
+            sim = jaccard(toks, bits[id(c)])
             if sim < 0.28:
                 continue
             if sim > best_score:
@@ -1115,7 +1442,7 @@ def cross_fill_locations(tournaments: List[Tournament]) -> List[Tournament]:
                 best_loc = c.location
 
         if best_loc and (best_loc != t.location):
-            updated.append(Tournament(**{**t.__dict__, "location": best_loc}))
+            updated.append(replace(t, location=best_loc))
         else:
             updated.append(t)
 
@@ -1125,23 +1452,27 @@ def cross_fill_locations(tournaments: List[Tournament]) -> List[Tournament]:
 # =========================================================
 # Export / Debug
 # =========================================================
+EXCEL_COLUMNS = ("start_date", "end_date", "title", "organizer", "tour", "location", "source", "source_url")
+excel_row = attrgetter("start_iso", "end_iso", "title", "organizer", "tour", "location", "source", "source_url")
+
+
 def export_excel(tournaments: List[Tournament], out_path: str) -> None:
-    rows = []
-    for t in tournaments:
-        rows.append(
-            {
-                "start_date": t.start_iso,
-                "end_date": t.end_iso,
-                "title": t.title,
-                "organizer": t.organizer,
-                "tour": t.tour,
-                "location": t.location,
-                "source": t.source,
-                "source_url": t.source_url,
-            }
-        )
-    df = pd.DataFrame(rows).sort_values(["start_date", "title"])
-    df.to_excel(out_path, index=False)
+    # Expects tournaments already sorted by (start, title).
+    if out_path.lower().endswith(".csv"):
+        with open(out_path, "w", newline="", encoding="utf-8") as f:
+            w = csv.writer(f)
+            w.writerow(EXCEL_COLUMNS)
+            w.writerows(map(excel_row, tournaments))
+        return
+
+    # Rows are streamed to disk in order (constant_memory); cells are written
+    # as plain strings, never turned into formulas or hyperlinks.
+    options = {"constant_memory": True, "strings_to_formulas": False, "strings_to_urls": False}
+    with xlsxwriter.Workbook(out_path, options) as wb:
+        ws = wb.add_worksheet()
+        ws.write_row(0, 0, EXCEL_COLUMNS, wb.add_format({"bold": True}))
+        for i, row in enumerate(map(excel_row, tournaments), 1):
+            ws.write_row(i, 0, row)
 
 
 def print_missing_locations(tournaments: List[Tournament], limit: int = 30) -> None:
@@ -1149,9 +1480,9 @@ def print_missing_locations(tournaments: List[Tournament], limit: int = 30) -> N
     if not missing:
         print("✅ No missing locations.")
         return
-    print(f"⚠️ Missing locations: {len(missing)} (showing {min(limit, len(missing))})")
-    for t in missing[:limit]:
-        print(f"  - {t.start_iso} {t.organizer} | {t.title} | {t.source_url}")
+    lines = [f"⚠️ Missing locations: {len(missing)} (showing {min(limit, len(missing))})"]
+    lines.extend(f"  - {t.start_iso} {t.organizer} | {t.title} | {t.source_url}" for t in missing[:limit])
+    sys.stdout.write("\n".join(lines) + "\n")
 
 
 # =========================================================
@@ -1161,11 +1492,27 @@ def parse_args() -> argparse.Namespace:
     p = argparse.ArgumentParser()
     p.add_argument("--from", dest="from_date", default=None, help="YYYY-MM-DD (default=today)")
     p.add_argument("--years", type=int, default=2, help="EPBF years to fetch (current + next by default)")
-    p.add_argument("--out", default="tournaments.xlsx", help="Output xlsx")
+    p.add_argument("--out", default="tournaments.xlsx", help="Output xlsx (or .csv)")
     p.add_argument("--wpa-enrich-limit", type=int, default=250, help="Max WPA event pages fetched for location")
     p.add_argument("--matchroom-enrich-limit", type=int, default=250, help="Max Matchroom pages fetched for location")
     p.add_argument("--epbf-enrich-limit", type=int, default=250, help="Max EPBF internal pages fetched for location")
-    p.add_argument("--sleep", type=float, default=0.0, help="Optional sleep between page fetches (seconds)")
+    p.add_argument(
+        "--sleep", type=float, default=0.0, help="Optional sleep after each page fetch, per worker (seconds)"
+    )
+    p.add_argument(
+        "--concurrency", type=int, default=HTTP_MAX_WORKERS, help="Max HTTP requests in flight (feeds + pages)"
+    )
+    p.add_argument(
+        "--quiet", action="store_true", help="Skip the first-events listing, keep the missing-locations report"
+    )
+    p.add_argument(
+        "--no-cache", action="store_true", help="Bypass the HTTP response and location caches (force a refresh)"
+    )
+    p.add_argument(
+        "--location-cache",
+        default=".location-cache.sqlite",
+        help="SQLite file caching detail page locations for 7 days (empty to disable)",
+    )
     return p.parse_args()
 
 
@@ -1174,36 +1521,52 @@ def main() -> int:
     from_d = date.today() if not args.from_date else date.fromisoformat(args.from_date)
     years = max(1, int(args.years))
 
-    all_t: List[Tournament] = []
-
-    # WPA / Matchroom
-    all_t.extend(fetch_wpa_ics(from_d, enrich_limit=max(0, args.wpa_enrich_limit), sleep_s=max(0.0, args.sleep)))
-    all_t.extend(
-        fetch_matchroom(from_d, enrich_limit=max(0, args.matchroom_enrich_limit), sleep_s=max(0.0, args.sleep))
-    )
+    configure_http(args.concurrency, None if args.no_cache else HTTP_CACHE_PATH)
+    if args.location_cache and not args.no_cache:
+        open_location_cache(args.location_cache)
 
-    # PBS OFFICIAL (NEW) + fallback
-    all_t.extend(fetch_pbs_official(from_d))
-    all_t.extend(fetch_pbs_fallback(from_d))
+    enrich_sleep = max(0.0, args.sleep)
 
-    # EPBF years
-    for y in range(from_d.year, from_d.year + years):
+    def fetch_epbf_year(y: int) -> List[Tournament]:
         try:
-            all_t.extend(fetch_epbf(y, from_d, enrich_limit=max(0, args.epbf_enrich_limit), sleep_s=max(0.0, args.sleep)))
+            return fetch_epbf(y, from_d, enrich_limit=max(0, args.epbf_enrich_limit), sleep_s=enrich_sleep)
         except Exception as e:
             print(f"[WARN] EPBF {y} failed: {e}", file=sys.stderr)
+            return []
+
+    tasks: List[Callable[[], List[Tournament]]] = [
+        # WPA / Matchroom
+        partial(fetch_wpa_ics, from_d, enrich_limit=max(0, args.wpa_enrich_limit), sleep_s=enrich_sleep),
+        partial(fetch_matchroom, from_d, enrich_limit=max(0, args.matchroom_enrich_limit), sleep_s=enrich_sleep),
+        # PBS OFFICIAL (NEW) + fallback
+        partial(fetch_pbs_official, from_d),
+        partial(fetch_pbs_fallback, from_d),
+        # EPBF years
+        *(partial(fetch_epbf_year, y) for y in range(from_d.year, from_d.year + years)),
+    ]
+
+    # Every source runs concurrently on its own pool (their page fetches go to HTTP_POOL);
+    # results are gathered in task order so dedup keeps its precedence.
+    with ThreadPoolExecutor(max_workers=len(tasks), thread_name_prefix="source") as ex:
+        futures = [ex.submit(task) for task in tasks]
+        all_t: List[Tournament] = list(chain.from_iterable(f.result() for f in futures))
 
     all_t = dedup(all_t)
-    all_t = cross_fill_locations(all_t)
-    all_t = sorted(all_t, key=lambda x: (x.start, x.title))
+    # Only events without a city-level location can be filled
+    if any(location_precision(t.location) < 2 for t in all_t):
+        all_t = cross_fill_locations(all_t)
+    all_t.sort(key=attrgetter("start", "title"))
 
     export_excel(all_t, args.out)
 
-    print(f"From: {from_d.isoformat()}")
-    print(f"Fetched {len(all_t)} events. First 25:")
-    for t in all_t[:25]:
-        loc = f" @ {t.location}" if t.location else ""
-        print(f"- {t.start_iso} → {t.end_iso} | {t.organizer} | {t.title}{loc}")
+    if args.quiet:
+        print(f"Fetched {len(all_t)} events.")
+    else:
+        lines = [f"From: {from_d.isoformat()}", f"Fetched {len(all_t)} events. First 25:"]
+        for t in all_t[:25]:
+            loc = f" @ {t.location}" if t.location else ""
+            lines.append(f"- {t.start_iso} → {t.end_iso} | {t.organizer} | {t.title}{loc}")
+        sys.stdout.write("\n".join(lines) + "\n")
 
     print_missing_locations(all_t, limit=40)
     print(f"\nWrote: {args.out}")